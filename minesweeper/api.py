@@ -1,5 +1,7 @@
 """Business logic classes and functions for a minesweeper game."""
 
+import collections
+import itertools
 import random
 import typing
 
@@ -8,12 +10,49 @@ from utilities import Point, points_around_point
 
 __all__ = (
     'Cell',
+    'CellRef',
     'Minefield',
 )
 
 
 _VALUE_MINE = -1  # Used to indicate that a cell is a mine
 
+# Each cell of a minefield is packed into a single byte
+_MASK_VALUE = 0x0F  # Bits 0-3 hold the cell's value
+_GRID_MINE = 0x0F  # Value bits of a mine cell
+_FLAG_FLAGGED = 0x10
+_FLAG_VISIBLE = 0x20
+
+
+def _display_byte(byte: int) -> int:
+    if byte & _FLAG_FLAGGED:
+        return ord('f')
+    if not byte & _FLAG_VISIBLE:
+        return ord(' ')
+    if (byte & _MASK_VALUE) == _GRID_MINE:
+        return ord('X')
+    return ord('0') + (byte & _MASK_VALUE)
+
+
+# Translation table from packed cell bytes to their display characters
+_DISPLAY_TABLE = bytes(_display_byte(byte) for byte in range(256))
+_GLYPHS = _DISPLAY_TABLE.decode('ascii')
+
+
+def _is_hidden_safe(byte: int) -> bool:
+    """Check if a packed cell still has to be revealed to win."""
+    return not byte & _FLAG_VISIBLE and (byte & _MASK_VALUE) != _GRID_MINE
+
+
+def _pack_cell(cell: 'Cell') -> int:
+    """Pack a cell's value and state into a single byte."""
+    byte = _GRID_MINE if cell.is_mine() else cell.value
+    if cell.flagged:
+        byte |= _FLAG_FLAGGED
+    if cell.visible:
+        byte |= _FLAG_VISIBLE
+    return byte
+
 
 class Cell:
     """An individual cell in a minefield.
@@ -29,15 +68,13 @@ class Cell:
      - :attr:`visible` tells if the cell has been revealed already
     """
 
+    __slots__ = ('value', 'flagged', 'visible')
+
     def __init__(self, value: int, *, flagged: bool=False, visible: bool=False) -> None:
-        self._value = value
+        self.value = value
         self.flagged = flagged
         self.visible = visible
 
-    @property
-    def value(self) -> int:
-        return self._value
-
     def is_mine(self) -> bool:
         """Check if the cell is a mine."""
         return self.value == _VALUE_MINE
@@ -46,26 +83,80 @@ class Cell:
         return 'Cell({self.value}, flagged={self.flagged}, visible={self.visible})'.format(self=self)
 
     def __str__(self) -> str:
-        if self.flagged:
-            return 'f'
-        if not self.visible:
-            return ' '
-        if self.is_mine():
-            return 'X'
-        return str(self.value)
+        return _GLYPHS[_pack_cell(self)]
+
+
+class CellRef(Cell):
+    """A view to a single cell stored inside a :class:`Minefield`.
+
+    Reading and writing the attributes goes straight to
+    the minefield's grid, so changes are reflected
+    in the minefield and vice versa.
+    """
+
+    __slots__ = ('_minefield', '_index')
+
+    def __init__(self, minefield: 'Minefield', index: int) -> None:
+        self._minefield = minefield
+        self._index = index
+
+    @property
+    def value(self) -> int:
+        value = self._minefield._grid[self._index] & _MASK_VALUE
+        return _VALUE_MINE if value == _GRID_MINE else value
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self._minefield._grid[self._index] & _FLAG_FLAGGED)
+
+    @flagged.setter
+    def flagged(self, flagged: bool) -> None:
+        self._minefield._set_bit(self._index, _FLAG_FLAGGED, flagged)
+
+    @property
+    def visible(self) -> bool:
+        return bool(self._minefield._grid[self._index] & _FLAG_VISIBLE)
+
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        self._minefield._set_bit(self._index, _FLAG_VISIBLE, visible)
+
+    def __str__(self) -> str:
+        return _GLYPHS[self._minefield._grid[self._index]]
 
 
 class Minefield:
     """A minefield of cells.
 
-    Wrapper around a two-dimensional list of cells with
-    a few extra methods for manipulating the cells.
+    The cells are stored in a flat row-major ``bytearray`` with
+    one byte per cell instead of individual :class:`Cell` objects.
+    Bits 0-3 of a byte hold the cell's value (``0x0F`` for a mine),
+    bit 4 tells if it's flagged, and bit 5 if it's visible.
+    Indexing the minefield returns a :class:`CellRef` view to the grid.
     """
 
     def __init__(self, size: Point, n_mines: int) -> None:
-        self._cells = [[Cell(0) for _ in range(size.x)] for _ in range(size.y)]
+        self._width, self._height = size
+        self._grid = bytearray(self._width * self._height)
+        self._points = tuple(
+            Point(x, y)
+            for y in range(self._height)
+            for x in range(self._width)
+        )
+        # Grid indices of the cells surrounding each cell
+        self._neighbors = tuple(
+            tuple(
+                y * self._width + x
+                for x, y in points_around_point(point)
+                if 0 <= x < self._width and 0 <= y < self._height
+            )
+            for point in self._points
+        )
         self._n_mines = n_mines
+        self._n_hidden_safe = len(self._grid)  # Non-mine cells not yet visible
         self._initialized = False
+        self._regions = None
+        self._region_ids = None
 
     @property
     def n_mines(self) -> int:
@@ -73,62 +164,83 @@ class Minefield:
 
     @property
     def width(self) -> int:
-        return len(self._cells[0])
+        return self._width
 
     @property
     def height(self) -> int:
-        return len(self._cells)
+        return self._height
 
     def __repr__(self) -> str:
         return 'Minefield({self.width}x{self.height}, n_mines={self.n_mines}'.format(self=self)
 
     def __str__(self) -> str:
+        text = self._grid.translate(_DISPLAY_TABLE).decode('ascii')
         return '\n'.join(
-            ''.join(str(cell) for cell in row)
-            for row in self._cells
+            text[i:i + self._width]
+            for i in range(0, len(text), self._width)
         )
 
-    def __getitem__(self, point: Point) -> Cell:
+    def _index_of(self, point: Point) -> int:
+        """Get the grid index of a point, raising for invalid points."""
         x, y = point  # Supports normal tuples along Point
-        if x < 0 or y < 0:
-            raise IndexError('Minefield doesn\'t support negative coordinates.')
-        return self._cells[y][x]
+        # (x | y) is negative if and only if either coordinate is
+        if (x | y) < 0 or x >= self._width or y >= self._height:
+            raise IndexError('Minefield index out of range.')
+        return y * self._width + x
+
+    def __getitem__(self, point: Point) -> CellRef:
+        return CellRef(self, self._index_of(point))
 
     def __setitem__(self, point: Point, cell: Cell) -> None:
-        x, y = point  # Supports normal tuples along Point
-        self._cells[y][x] = cell
+        self._set_byte(self._index_of(point), _pack_cell(cell))
+        self._regions = None
+
+    def _set_byte(self, index: int, byte: int) -> None:
+        self._n_hidden_safe += _is_hidden_safe(byte) - _is_hidden_safe(self._grid[index])
+        self._grid[index] = byte
 
-    def __iter__(self) -> typing.Iterator[Cell]:
-        for row in self._cells:
-            yield from row
+    def _set_bit(self, index: int, bit: int, state: bool) -> None:
+        byte = self._grid[index]
+        self._set_byte(index, byte | bit if state else byte & ~bit)
+
+    def __iter__(self) -> typing.Iterator[CellRef]:
+        return map(CellRef, itertools.repeat(self), range(len(self._grid)))
 
     def iter_points(self) -> typing.Iterator[Point]:
         """Iterate through the cells' ``(x, y)`` points."""
-        for y, row in enumerate(self._cells):
-            for x in range(len(row)):
-                yield Point(x, y)
+        return iter(self._points)
 
-    def cells_around_point(self, point: Point) -> typing.Iterator[Cell]:
+    def cells_around_point(self, point: Point) -> typing.Iterator[CellRef]:
         """Iterate through the cells surrounding a point."""
-        for p in points_around_point(point):
-            try:
-                yield self[p]
-            except IndexError:
-                pass
+        neighbors = self._neighbors[self._index_of(point)]
+        return map(CellRef, itertools.repeat(self), neighbors)
+
+    def _count_around_index(self, index: int, mask: int, bits: int) -> int:
+        """Count the cells around an index whose ``byte & mask`` equals ``bits``."""
+        grid, width = self._grid, self._width
+        y, x = divmod(index, width)
+        left, right = max(x - 1, 0), min(x + 2, width)
+        count = -((grid[index] & mask) == bits)  # The 3x3 loop counts the cell itself
+        for row in range(max(y - 1, 0) * width, min(y + 2, self._height) * width, width):
+            for byte in grid[row + left:row + right]:
+                if (byte & mask) == bits:
+                    count += 1
+        return count
 
     def count_mines_around_point(self, point: Point) -> int:
         """Get the number of mine cells around a point."""
-        return sum(cell.is_mine() for cell in self.cells_around_point(point))
+        return self._count_around_index(self._index_of(point), _MASK_VALUE, _GRID_MINE)
 
     def count_flags_around_point(self, point: Point) -> int:
         """Get the number of flagged cells around a point."""
-        return sum(cell.flagged for cell in self.cells_around_point(point))
+        return self._count_around_index(self._index_of(point), _FLAG_FLAGGED, _FLAG_FLAGGED)
 
     def reset(self) -> None:
-        """Reset the minefield's cells to new ``Cell(0)`` instances."""
-        for point in self.iter_points():
-            self[point] = Cell(0)
+        """Reset the minefield's cells to the state of ``Cell(0)``."""
+        self._grid = bytearray(len(self._grid))
+        self._n_hidden_safe = len(self._grid)
         self._initialized = False
+        self._regions = None
 
     def init_mines(self, *, restricted_points: typing.Set[Point]=set(), reset: bool=True) -> None:
         """Initialize the minefield with :attr:`n_mines` mines.
@@ -140,38 +252,98 @@ class Minefield:
             self.reset()
         self._initialized = True
 
-        allowed_points = list(set(self.iter_points()) - restricted_points)
-        random.shuffle(allowed_points)
-        mine_points = allowed_points[:self.n_mines]
-        other_points = set(allowed_points[self.n_mines:]) | restricted_points
-
-        for point in mine_points:
-            self[point] = Cell(_VALUE_MINE)
-        for point in other_points:
-            self[point] = Cell(self.count_mines_around_point(point))
+        n_cells = len(self._grid)
+        restricted_indices = {self._index_of(point) for point in restricted_points}
+        if restricted_indices:
+            allowed_indices = [i for i in range(n_cells) if i not in restricted_indices]
+        else:
+            allowed_indices = range(n_cells)  # random.sample() accepts any sequence
+        mine_indices = random.sample(allowed_indices, min(self.n_mines, len(allowed_indices)))
+
+        # Count the mines by incrementing each mine's neighbours,
+        # instead of scanning the neighbours of every cell
+        grid = bytearray(n_cells)
+        for index in mine_indices:
+            grid[index] = _GRID_MINE
+        for index in mine_indices:
+            for i in self._neighbors[index]:
+                if grid[i] != _GRID_MINE:
+                    grid[i] += 1
+        self._grid = grid
+        self._n_hidden_safe = n_cells - len(mine_indices)
+        self._regions = None
+
+    def _label_zero_regions(self) -> None:
+        """Label the connected regions of ``0`` cells.
+
+        Each region is stored as a tuple of its ``0`` cells' indices
+        and a tuple of the non-zero cells bordering it, which together
+        are the cells a flood fill from inside the region would reveal.
+        """
+        grid = self._grid
+        region_ids = [-1] * len(grid)
+        regions = []
+        for start in range(len(grid)):
+            if grid[start] & _MASK_VALUE or region_ids[start] != -1:
+                continue
+            region_id = region_ids[start] = len(regions)
+            zeros, border = [start], set()
+            queue = collections.deque(zeros)
+            while queue:
+                for i in self._neighbors[queue.popleft()]:
+                    if grid[i] & _MASK_VALUE:
+                        border.add(i)
+                    elif region_ids[i] == -1:
+                        region_ids[i] = region_id
+                        zeros.append(i)
+                        queue.append(i)
+            regions.append((tuple(zeros), tuple(border)))
+        self._regions = regions
+        self._region_ids = region_ids
 
     def reveal_cell_at(self, point: Point, *, recursive: bool=True) -> None:
         """Attempt to reveal a cell at given ``(x, y)`` coordinates.
 
-        If ``recursive`` is set to ``True``, this will recursively
-        reveal all the surrounding cells  if the cell's value was
-        equal to ``0``.
+        If ``recursive`` is set to ``True``, this will also reveal
+        all the surrounding cells if the cell's value was equal
+        to ``0``, continuing through any further ``0`` cells.
 
         Flagged cells cannot be revealed.
         """
         if not self._initialized:
             self.init_mines(restricted_points={point}, reset=False)
-        cell = self[point]
-        if cell.flagged or cell.visible:
+        grid = self._grid
+        index = self._index_of(point)
+        if grid[index] & (_FLAG_FLAGGED | _FLAG_VISIBLE):
+            return
+        self._n_hidden_safe -= _is_hidden_safe(grid[index])
+        grid[index] |= _FLAG_VISIBLE
+        if not recursive or grid[index] & _MASK_VALUE:
             return
-        cell.visible = True
-        if cell.value == 0 and recursive:
-            for p in points_around_point(point):
-                try:
-                    self.reveal_cell_at(p)
-                except IndexError:
-                    pass
+
+        if self._regions is None:
+            self._label_zero_regions()
+        zeros, border = self._regions[self._region_ids[index]]
+        if not any(grid[i] & _FLAG_FLAGGED for i in zeros):
+            for i in itertools.chain(zeros, border):
+                if not grid[i] & _FLAG_FLAGGED:
+                    self._n_hidden_safe -= _is_hidden_safe(grid[i])
+                    grid[i] |= _FLAG_VISIBLE
+            return
+
+        # A flag inside the region blocks the fill, so fall back to a
+        # breadth-first flood fill, cells are marked visible when queued
+        queue = collections.deque([index])
+        while queue:
+            index = queue.popleft()
+            if grid[index] & _MASK_VALUE:
+                continue
+            for i in self._neighbors[index]:
+                if not grid[i] & (_FLAG_FLAGGED | _FLAG_VISIBLE):
+                    self._n_hidden_safe -= _is_hidden_safe(grid[i])
+                    grid[i] |= _FLAG_VISIBLE
+                    queue.append(i)
 
     def is_fully_revealed(self) -> bool:
         """Check if the minefield is fully revealed, i.e. game won."""
-        return all(cell.visible or cell.is_mine() for cell in self)
+        return self._n_hidden_safe == 0
@@ -25,6 +25,8 @@ def parse_args():
 MOUSE1 = 1
 MOUSE2 = 3
 
+CELL_GLYPHS = ' fX012345678'  # Every possible str() of a cell
+
 
 class Scene:
 
@@ -40,6 +42,10 @@ class Scene:
     def _font_renderer(self, text):
         return self.font.render(text, 1, self.fg_color)
 
+    def _prerender(self, texts):
+        for text in texts:
+            self._render_cache[text]
+
     def draw(self):
         pass
 
@@ -66,25 +72,28 @@ class Menu(Scene):
     def __init__(self, fps, options):
         super().__init__(fps)
         self.options = options
+        self._prerender(option.text for option in options)
+        self._font_height = self.font.get_height()
+        self._update_layout()
 
-    def _vertical_distance_between_options(self):
+    def _update_layout(self):
         height = self.screen.get_size()[1]
-        return height // len(self.options)
+        self._step = height // len(self.options)
+        self._text_offset = (self._step - self._font_height) // 2
 
     def draw(self):
-        step = self._vertical_distance_between_options()
-        offset = (step - self.font.get_height()) // 2
         for i, option in enumerate(self.options):
-            pos = (20, i * step + offset)
+            pos = (20, i * self._step + self._text_offset)
             text = self._render_cache[option.text]
             self.screen.blit(text, pos)
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
             self.running = False
+        elif event.type == pygame.VIDEORESIZE:
+            self._update_layout()
         elif event.type == pygame.MOUSEBUTTONUP and event.button == MOUSE1:
-            step = self._vertical_distance_between_options()
-            option_index = event.pos[1] // step
+            option_index = event.pos[1] // self._step
             game = self.options[option_index].game
             game.minefield.reset()
             game.run()
@@ -95,27 +104,62 @@ class Game(Scene):
     def __init__(self, fps, minefield):
         super().__init__(fps)
         self.minefield = minefield
-
-    def draw(self):
+        self._prerender(CELL_GLYPHS)
+        self._board_surface = pygame.Surface(self.screen.get_size())
+        self._drawn_glyphs = [None] * (minefield.width * minefield.height)
+        self._dirty = True
+        self._layout()
+        self._draw_grid()
+
+    def _layout(self):
         screenw, screenh = self.screen.get_size()
         cellw, cellh = screenw / self.minefield.width, screenh / self.minefield.height
-        for x in range(self.minefield.width):
-            for y in range(self.minefield.height):
-                cell = self.minefield[x, y]
-                text = self._render_cache[str(cell)]
-                px, py = x * cellw, y * cellh
-                self.screen.blit(text, (px, py))
-                pygame.draw.line(self.screen, self.fg_color, (px, 0), (px, screenh))
-                pygame.draw.line(self.screen, self.fg_color, (0, py), (screenw, py))
+        self._cell_size = cellw, cellh
+        self._cell_rects = []
+        for y in range(self.minefield.height):
+            py, next_py = int(y * cellh), int((y + 1) * cellh)
+            for x in range(self.minefield.width):
+                px, next_px = int(x * cellw), int((x + 1) * cellw)
+                self._cell_rects.append(pygame.Rect(px, py, next_px - px, next_py - py))
+
+    def _draw_grid(self):
+        screenw, screenh = self.screen.get_size()
+        self._board_surface.fill(self.bg_color)
+        for rect in self._cell_rects[:self.minefield.width]:
+            pygame.draw.line(self._board_surface, self.fg_color, (rect.left, 0), (rect.left, screenh))
+        for rect in self._cell_rects[::self.minefield.width]:
+            pygame.draw.line(self._board_surface, self.fg_color, (0, rect.top), (screenw, rect.top))
+
+    def _redraw_changed_cells(self):
+        surface, fg_color, drawn_glyphs = self._board_surface, self.fg_color, self._drawn_glyphs
+        for index, (rect, cell) in enumerate(zip(self._cell_rects, self.minefield)):
+            glyph = str(cell)
+            if glyph == drawn_glyphs[index]:
+                continue
+            drawn_glyphs[index] = glyph
+            surface.fill(self.bg_color, rect)
+            surface.blit(self._render_cache[glyph], rect.topleft, (0, 0, rect.width, rect.height))
+            pygame.draw.line(surface, fg_color, rect.topleft, rect.bottomleft)
+            pygame.draw.line(surface, fg_color, rect.topleft, rect.topright)
+
+    def draw(self):
+        if self._dirty:
+            self._redraw_changed_cells()
+            self._dirty = False
+        self.screen.blit(self._board_surface, (0, 0))
+
+    def run(self):
+        self._dirty = True
+        super().run()
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
             self.running = False
         elif event.type == pygame.MOUSEBUTTONUP:
-            screenw, screenh = self.screen.get_size()
-            cellw, cellh = screenw / self.minefield.width, screenh / self.minefield.height
+            cellw, cellh = self._cell_size
             x, y = int(event.pos[0] / cellw), int(event.pos[1] / cellh)
             cell = self.minefield[x, y]
+            self._dirty = True
             if event.button == MOUSE1:
                 self.minefield.reveal_cell_at(utilities.Point(x, y))
                 if cell.visible:
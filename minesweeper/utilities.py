@@ -23,11 +23,15 @@ class KeyDefaultDict(typing.DefaultDict):
 Point = typing.NamedTuple('Point', [('x', int), ('y', int)])
 
 
-def points_around_point(point: Point) -> typing.Iterator[Point]:
-    """Iterate through the points surrounding a point."""
+_NEIGHBOR_OFFSETS = tuple(
+    (dx, dy)
+    for dy in (-1, 0, 1)
+    for dx in (-1, 0, 1)
+    if (dx, dy) != (0, 0)
+)
+
+
+def points_around_point(point: Point) -> typing.List[Point]:
+    """Get the points surrounding a point."""
     px, py = point  # Supports normal tuples along Point
-    for x in range(px - 1, px + 2):
-        for y in range(py - 1, py + 2):
-            if x == px and y == py:
-                continue
-            yield Point(x, y)
+    return [Point(px + dx, py + dy) for dx, dy in _NEIGHBOR_OFFSETS]